@@ -0,0 +1,80 @@
+"""Command Quest output benchmark.
+
+This module compares printing one argument per print() call, as
+ft_command_quest originally did, with the batched argument writer.
+
+Example: python3 benchmarks/bench_command_quest.py 1000000
+"""
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from ex0.ft_command_quest import (  # noqa: E402
+    iter_arguments,
+    write_arguments
+)
+
+
+def print_arguments(arguments, out):
+    """Print arguments the way ft_command_quest.main originally did.
+
+    Args:
+        arguments: A list of arguments.
+        out: A text stream to write to.
+
+    Returns:
+        int: The number of arguments written.
+    """
+    i = 0
+    while i < len(arguments):
+        print(f"Argument {i + 1}: {arguments[i]}", file=out)
+        i += 1
+    return i
+
+
+def timed(function):
+    """Run a function once and return its result and wall time.
+
+    Args:
+        function: A callable taking no arguments.
+
+    Returns:
+        tuple: The result and the elapsed time in seconds.
+    """
+    start = time.perf_counter()
+    result = function()
+    return result, time.perf_counter() - start
+
+
+def main():
+    """Run the output benchmark and print arguments per second."""
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 1000000
+    arguments = [f"arg{i}" for i in range(size)]
+
+    with tempfile.TemporaryDirectory() as directory:
+        argfile = os.path.join(directory, "args.txt")
+        with open(argfile, "w", encoding="utf-8") as stream:
+            stream.write("\n".join(arguments) + "\n")
+
+        print(f"=== Command Quest Benchmark ({size} arguments) ===")
+        with open(os.devnull, "w", encoding="utf-8", buffering=1) as out:
+            cases = {
+                "print() per argument": lambda: print_arguments(
+                    arguments, out
+                ),
+                "batched writer": lambda: write_arguments(arguments, out),
+                "batched writer (@argfile)": lambda: write_arguments(
+                    iter_arguments([f"@{argfile}"]), out
+                )
+            }
+            for name, function in cases.items():
+                count, elapsed = timed(function)
+                print(f"{name:<27} {elapsed:8.4f} s "
+                      f"{count / elapsed:14,.0f} args/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+"""Integer parsing microbenchmark.
+
+This module compares the original per-token int() loop used to read
+scores with the bulk parsers of ft_score_analytics. Both spend most of
+their time in int(), so throughput is roughly on par; the bulk parsers
+mainly cut peak memory by storing the values in an array('q').
+
+Example: python3 benchmarks/bench_int_parsing.py 1000000
+"""
+import os
+import random
+import sys
+import timeit
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from ex1.ft_score_analytics import (  # noqa: E402
+    parse_int_buffer,
+    parse_int_tokens
+)
+
+
+def loop_parse(tokens):
+    """Parse tokens the way ft_score_analytics.main originally did.
+
+    Args:
+        tokens: A sequence of str or bytes tokens.
+
+    Returns:
+        list: The parsed integers, or None on the first invalid token.
+    """
+    scores = []
+    for value in tokens:
+        try:
+            scores.append(int(value))
+        except ValueError:
+            return None
+    return scores
+
+
+def best_time(function, repeat=5):
+    """Return the best wall time of several single runs.
+
+    Args:
+        function: A callable taking no arguments.
+        repeat: The number of runs.
+
+    Returns:
+        float: The fastest run, in seconds.
+    """
+    return min(timeit.repeat(function, number=1, repeat=repeat))
+
+
+def peak_memory(function):
+    """Return the peak traced allocation size of a single run.
+
+    Args:
+        function: A callable taking no arguments.
+
+    Returns:
+        int: The peak allocated size, in bytes.
+    """
+    tracemalloc.start()
+    function()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak
+
+
+def main():
+    """Run the parsing microbenchmark and print throughput and memory."""
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 1000000
+    rng = random.Random(42)
+    tokens = [str(rng.randint(0, 100000)) for _ in range(size)]
+    buffer = "\n".join(tokens).encode()
+
+    print(f"=== Integer Parsing Benchmark ({size} tokens) ===")
+    cases = {
+        "int() loop (argv)": lambda: loop_parse(tokens),
+        "parse_int_tokens (argv)": lambda: parse_int_tokens(tokens),
+        "int() loop (bytes)": lambda: loop_parse(buffer.split()),
+        "parse_int_buffer (bytes)": lambda: parse_int_buffer(buffer)
+    }
+    for name, function in cases.items():
+        elapsed = best_time(function)
+        peak = peak_memory(function) / (1 << 20)
+        print(f"{name:<26} {elapsed:8.4f} s "
+              f"{size / elapsed:12,.0f} tok/s {peak:8.1f} MiB peak")
+
+
+if __name__ == "__main__":
+    main()
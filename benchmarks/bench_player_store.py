@@ -0,0 +1,64 @@
+"""Out-of-core player store benchmark.
+
+This module builds sharded player stores of growing sizes from the
+synthetic player stream and measures the throughput (players scanned per
+second) and peak traced Python memory of the out-of-core queries.
+
+Example: python3 benchmarks/bench_player_store.py 10000 100000 1000000
+"""
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from dataset_generator import generate_players  # noqa: E402
+from player_store import (  # noqa: E402
+    build_store,
+    get_active_regions,
+    get_high_scorers,
+    get_rare_achievements
+)
+
+DEFAULT_SIZES = (10000, 100000)
+
+QUERIES = {
+    "get_high_scorers": lambda store: sum(1 for _ in get_high_scorers(store)),
+    "get_active_regions": get_active_regions,
+    "get_rare_achievements": get_rare_achievements
+}
+
+
+def measure(function, store):
+    """Run a query once and return its wall time and peak traced memory."""
+    tracemalloc.start()
+    start = time.perf_counter()
+    function(store)
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, peak
+
+
+def main():
+    """Build stores of each size and print one line per query."""
+    sizes = [int(arg) for arg in sys.argv[1:]] or DEFAULT_SIZES
+
+    print("=== Player Store Benchmark ===")
+    print(f"{'query':<24}{'players':>10}{'players/sec':>14}{'peak KiB':>10}")
+    for size in sizes:
+        with tempfile.TemporaryDirectory() as directory:
+            start = time.perf_counter()
+            store = build_store(directory, generate_players(size))
+            build_time = time.perf_counter() - start
+            print(f"{'build_store':<24}{size:>10}{size / build_time:>14,.0f}")
+            for name, function in QUERIES.items():
+                elapsed, peak = measure(function, store)
+                print(f"{name:<24}{size:>10}{size / elapsed:>14,.0f}"
+                      f"{peak / 1024:>10,.1f}")
+
+
+if __name__ == "__main__":
+    main()
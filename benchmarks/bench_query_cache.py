@@ -0,0 +1,91 @@
+"""Dashboard query cache benchmark.
+
+This module simulates repeated dashboard refreshes over a synthetic
+player population, with a player update between refreshes, and compares
+running every query each time with going through query_cache.
+
+Example: python3 benchmarks/bench_query_cache.py 100000 50
+"""
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from dataset_generator import (  # noqa: E402
+    REGIONS,
+    dashboard_entry,
+    generate_players
+)
+from query_cache import (  # noqa: E402
+    QUERIES,
+    cache_stats,
+    cached_query,
+    new_cache,
+    new_dataset,
+    update_player
+)
+
+DASHBOARD_QUERIES = [
+    query for query, (module_name, _, _) in QUERIES.items()
+    if module_name == "ex6.ft_analytics_dashboard"
+]
+
+
+def mutate(dataset, refresh):
+    """Apply the player update made before a refresh.
+
+    Most refreshes only move a player to another region; every fifth one
+    changes a score.
+    """
+    name = f"player_{refresh}"
+    if refresh % 5 == 0:
+        update_player(dataset, name, {"score": refresh})
+    else:
+        update_player(dataset, name, {"region": REGIONS[refresh % 5]})
+
+
+def refresh_dashboard(dataset, cache=None):
+    """Run every dashboard query once, through the cache if one is given."""
+    for query in DASHBOARD_QUERIES:
+        if cache is None:
+            module_name, function_name, _ = QUERIES[query]
+            module = __import__(module_name, fromlist=[function_name])
+            getattr(module, function_name)(dataset["players"])
+        else:
+            cached_query(cache, dataset, query)
+
+
+def timed_refreshes(refreshes, size, cache=None):
+    """Time a series of mutate-and-refresh rounds.
+
+    Returns:
+        float: The elapsed time of the rounds, in seconds.
+    """
+    dataset = new_dataset(dict(map(dashboard_entry, generate_players(size))))
+    start = time.perf_counter()
+    for refresh in range(refreshes):
+        mutate(dataset, refresh)
+        refresh_dashboard(dataset, cache)
+    return time.perf_counter() - start
+
+
+def main():
+    """Run the cache benchmark and print timings and cache statistics."""
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    refreshes = int(sys.argv[2]) if len(sys.argv) > 2 else 50
+
+    print(f"=== Query Cache Benchmark ({size} players, "
+          f"{refreshes} refreshes) ===")
+    uncached = timed_refreshes(refreshes, size)
+    cache = new_cache()
+    cached = timed_refreshes(refreshes, size, cache)
+    print(f"Uncached: {uncached:.3f} s")
+    print(f"Cached:   {cached:.3f} s ({uncached / cached:.1f}x faster)")
+    for name, value in cache_stats(cache).items():
+        print(f"{name}: {value:.2f}" if isinstance(value, float)
+              else f"{name}: {value}")
+
+
+if __name__ == "__main__":
+    main()
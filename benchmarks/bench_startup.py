@@ -0,0 +1,140 @@
+"""game-tools startup benchmark.
+
+This module measures the cold-start latency of each game-tools subcommand
+(a fresh interpreter per call, with the import cost reported by
+-X importtime) and the warm-call latency of the same subcommands served
+by a running game-tools server.
+
+Example: python3 benchmarks/bench_startup.py 10
+"""
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from game_tools import COMMANDS, call_server  # noqa: E402
+
+GAME_TOOLS = os.path.join(ROOT, "game_tools.py")
+
+COMMAND_ARGS = {
+    "quest": ["first", "second"],
+    "scores": ["1500", "2300", "1800"]
+}
+
+
+def parse_importtime(stderr, module_name):
+    """Extract import costs from -X importtime output.
+
+    Args:
+        stderr: The standard error text of the run.
+        module_name: The dotted name of the subcommand module.
+
+    Returns:
+        tuple: A tuple containing:
+            - The total self import time of the run, in microseconds
+            - The cumulative import time of the subcommand module
+    """
+    total = 0
+    module_cumulative = 0
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_time, cumulative, name = line[len("import time:"):].split("|")
+        total += int(self_time)
+        if name.strip() == module_name:
+            module_cumulative = int(cumulative)
+    return total, module_cumulative
+
+
+def cold_start(command, repeat):
+    """Time fresh-interpreter runs of one subcommand.
+
+    Args:
+        command: A key of COMMANDS.
+        repeat: The number of runs.
+
+    Returns:
+        tuple: The best wall time in seconds, and the import costs of
+            that run as returned by parse_importtime().
+    """
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = subprocess.run(
+            [sys.executable, "-X", "importtime", GAME_TOOLS, command]
+            + COMMAND_ARGS.get(command, []),
+            capture_output=True, text=True, check=True
+        )
+        elapsed = time.perf_counter() - start
+        if best is None or elapsed < best[0]:
+            imports = parse_importtime(result.stderr, COMMANDS[command])
+            best = (elapsed, imports)
+    return best
+
+
+def warm_calls(socket_path, command, repeat):
+    """Time calls of one subcommand served by a running server.
+
+    Args:
+        socket_path: The socket the server listens on.
+        command: A key of COMMANDS.
+        repeat: The number of calls.
+
+    Returns:
+        float: The best call latency, in seconds.
+    """
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        call_server(socket_path, [command] + COMMAND_ARGS.get(command, []))
+        elapsed = time.perf_counter() - start
+        if best is None or elapsed < best:
+            best = elapsed
+    return best
+
+
+def start_server(socket_path):
+    """Start a game-tools server and wait until it accepts calls.
+
+    Args:
+        socket_path: The socket path for the server to listen on.
+
+    Returns:
+        subprocess.Popen: The server process.
+    """
+    server = subprocess.Popen(
+        [sys.executable, GAME_TOOLS, "serve", socket_path],
+        stdout=subprocess.PIPE, text=True
+    )
+    server.stdout.readline()
+    return server
+
+
+def main():
+    """Run the startup benchmark and print one line per subcommand."""
+    repeat = int(sys.argv[1]) if len(sys.argv) > 1 else 10
+
+    with tempfile.TemporaryDirectory() as directory:
+        socket_path = os.path.join(directory, "game-tools.sock")
+        server = start_server(socket_path)
+        try:
+            print(f"=== game-tools Startup Benchmark (best of {repeat}) ===")
+            print(f"{'command':<14}{'cold (ms)':>11}{'imports (ms)':>14}"
+                  f"{'module (ms)':>13}{'warm (ms)':>11}")
+            for command in COMMANDS:
+                elapsed, (imports, module) = cold_start(command, repeat)
+                warm = warm_calls(socket_path, command, repeat)
+                print(f"{command:<14}{elapsed * 1000:>11.1f}"
+                      f"{imports / 1000:>14.1f}{module / 1000:>13.1f}"
+                      f"{warm * 1000:>11.2f}")
+        finally:
+            server.terminate()
+            server.wait()
+
+
+if __name__ == "__main__":
+    main()
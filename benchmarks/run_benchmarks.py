@@ -0,0 +1,355 @@
+"""Cross-module benchmark suite with regression tracking.
+
+This module benchmarks the hot paths of every exercise module over
+synthetic datasets of several sizes, built from the seeded streams of
+dataset_generator. It records throughput (items processed per second)
+and peak traced memory to JSON, and compares the results with a stored
+baseline.
+
+Example:
+    python3 benchmarks/run_benchmarks.py --update-baseline
+    python3 benchmarks/run_benchmarks.py --output results.json
+"""
+import argparse
+import json
+import os
+import platform
+import sys
+import timeit
+import tracemalloc
+from contextlib import redirect_stdout
+from itertools import islice
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from dataset_generator import (  # noqa: E402
+    achievement_entry,
+    dashboard_entry,
+    generate_coordinates,
+    generate_inventories,
+    generate_players,
+    iter_inventories
+)
+from ex2.ft_coordinate_system import (  # noqa: E402
+    distance_3d,
+    parse_coordinates
+)
+from ex3.ft_achievement_tracker import (  # noqa: E402
+    get_all_achievements,
+    get_rare_achievements
+)
+from ex4.ft_inventory_system import (  # noqa: E402
+    inventory_value,
+    transfer_item
+)
+from ex5.ft_data_stream import (  # noqa: E402
+    game_event_stream,
+    prime_generator
+)
+from ex6 import ft_analytics_dashboard as dashboard  # noqa: E402
+
+DEFAULT_BASELINE = os.path.join(ROOT, "benchmarks", "baseline.json")
+DEFAULT_SIZES = (1000, 10000, 100000)
+PRIME_SIZES = (1000, 5000, 20000)
+SEED = 42
+DEFAULT_REPEAT = 5
+MIN_RUN_TIME = 0.2
+MEMORY_FLOOR = 64 * 1024
+
+# get_scores_doubled and get_score_categories return constants whatever
+# the players, so their throughput per player would be meaningless.
+DASHBOARD_QUERIES = (
+    "get_high_scorers",
+    "get_active_players",
+    "get_player_scores",
+    "get_achievement_counts",
+    "get_unique_players",
+    "get_active_regions"
+)
+
+
+def make_achievement_players(size, seed):
+    """Build a players dict in the ft_achievement_tracker format."""
+    return dict(map(achievement_entry, generate_players(size, seed)))
+
+
+def make_inventory(size, seed):
+    """Build a single inventory of size items in ft_inventory_system format.
+
+    The items of consecutive generated inventories are pooled together.
+    """
+    records = islice(generate_inventories(size, seed=seed), size)
+    inventory = {}
+    for index, (_, data) in enumerate(iter_inventories(records)):
+        for item, item_data in data.items():
+            inventory[f"{item}_{index}"] = item_data
+    return inventory
+
+
+def make_dashboard_players(size, seed):
+    """Build a players dict in the ft_analytics_dashboard format."""
+    return dict(map(dashboard_entry, generate_players(size, seed)))
+
+
+def bench_distance_3d(size, seed):
+    """Return a run computing the distance between size point pairs."""
+    points = list(generate_coordinates(size + 1, seed=seed))
+    pairs = list(zip(points, points[1:]))
+
+    def run():
+        for point1, point2 in pairs:
+            distance_3d(point1, point2)
+    return run
+
+
+def bench_parse_coordinates(size, seed):
+    """Return a run parsing size coordinate strings."""
+    strings = [
+        f"{x},{y},{z}" for x, y, z in generate_coordinates(size, seed=seed)
+    ]
+
+    def run():
+        for coord_str in strings:
+            parse_coordinates(coord_str)
+    return run
+
+
+def bench_get_rare_achievements(size, seed):
+    """Return a run finding the rare achievements of size players."""
+    players = make_achievement_players(size, seed)
+    all_achievements = get_all_achievements(players)
+    return lambda: get_rare_achievements(players, all_achievements)
+
+
+def bench_transfer_item(size, seed):
+    """Return a run transferring one unit of each of size items."""
+    giver = make_inventory(size, seed)
+    for data in giver.values():
+        data["quantity"] = 10 ** 9
+    receiver = {}
+    items = list(giver)
+
+    def run():
+        with open(os.devnull, "w", encoding="utf-8") as devnull:
+            with redirect_stdout(devnull):
+                for item in items:
+                    transfer_item(giver, receiver, item, 1)
+    return run
+
+
+def bench_inventory_value(size, seed):
+    """Return a run valuing an inventory of size items."""
+    inventory = make_inventory(size, seed)
+    return lambda: inventory_value(inventory)
+
+
+def bench_prime_generator(size, seed):
+    """Return a run taking the first size primes."""
+    def run():
+        primes = prime_generator()
+        for _ in range(size):
+            next(primes)
+    return run
+
+
+def bench_game_event_stream(size, seed):
+    """Return a run consuming a stream of size game events."""
+    def run():
+        for _ in game_event_stream(size):
+            pass
+    return run
+
+
+def make_dashboard_bench(query):
+    """Build the benchmark setup for one dashboard get_* function."""
+    function = getattr(dashboard, query)
+
+    def setup(size, seed):
+        players = make_dashboard_players(size, seed)
+        return lambda: function(players)
+    setup.__doc__ = f"Return a run of {query} over size players."
+    return setup
+
+
+CASES = {
+    "distance_3d": (bench_distance_3d, DEFAULT_SIZES),
+    "parse_coordinates": (bench_parse_coordinates, DEFAULT_SIZES),
+    "get_rare_achievements": (bench_get_rare_achievements, DEFAULT_SIZES),
+    "transfer_item": (bench_transfer_item, DEFAULT_SIZES),
+    "inventory_value": (bench_inventory_value, DEFAULT_SIZES),
+    "prime_generator": (bench_prime_generator, PRIME_SIZES),
+    "game_event_stream": (bench_game_event_stream, DEFAULT_SIZES)
+}
+CASES.update({
+    f"dashboard.{query}": (make_dashboard_bench(query), DEFAULT_SIZES)
+    for query in DASHBOARD_QUERIES
+})
+
+
+def measure(run, size, repeat, min_time=MIN_RUN_TIME):
+    """Measure the throughput and peak memory of a benchmark run.
+
+    Each timing loops over run enough times to last at least min_time,
+    so that fast runs are not dominated by timer and scheduling noise.
+
+    Args:
+        run: A callable processing size items.
+        size: The number of items processed by one call of run.
+        repeat: The number of timings; the fastest one is kept.
+        min_time: The minimum duration of one timing, in seconds.
+
+    Returns:
+        dict: The 'ops_per_sec' and 'peak_bytes' of the run.
+    """
+    timer = timeit.Timer(run)
+    number = 1
+    while timer.timeit(number) < min_time:
+        number *= 2
+    best = min(timer.repeat(repeat=repeat, number=number)) / number
+    tracemalloc.start()
+    run()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return {"ops_per_sec": size / best, "peak_bytes": peak}
+
+
+def run_suite(names, sizes=None, repeat=DEFAULT_REPEAT,
+              min_time=MIN_RUN_TIME):
+    """Run the selected benchmarks.
+
+    Args:
+        names: The CASES keys to run.
+        sizes: Dataset sizes overriding each case's defaults, or None.
+        repeat: The number of timings per measurement.
+        min_time: The minimum duration of one timing, in seconds.
+
+    Yields:
+        tuple: The result key ("name[size]") and its measurement.
+    """
+    for name in names:
+        setup, default_sizes = CASES[name]
+        for size in sizes or default_sizes:
+            run = setup(size, SEED)
+            yield f"{name}[{size}]", measure(run, size, repeat, min_time)
+
+
+def find_regressions(results, baseline, threshold,
+                     memory_floor=MEMORY_FLOOR):
+    """Compare results with a baseline.
+
+    A result regresses when its throughput drops, or its peak memory
+    grows, by more than threshold (a fraction) relative to the baseline.
+    Peak memory growth below memory_floor bytes is ignored, as small
+    peaks vary with allocator and interpreter state.
+
+    Args:
+        results: A mapping of result keys to measurements.
+        baseline: A mapping of result keys to baseline measurements.
+        threshold: The tolerated relative change, e.g. 0.25.
+        memory_floor: The tolerated absolute peak memory growth.
+
+    Returns:
+        list: Messages describing each regression.
+    """
+    regressions = []
+    for key, result in results.items():
+        if key not in baseline:
+            continue
+        expected = baseline[key]
+        speed = result["ops_per_sec"] / expected["ops_per_sec"] - 1
+        if speed < -threshold:
+            regressions.append(f"{key}: throughput {speed:+.0%}")
+        growth = result["peak_bytes"] - expected["peak_bytes"]
+        if growth > max(threshold * expected["peak_bytes"], memory_floor):
+            regressions.append(
+                f"{key}: peak memory +{growth / 1024:,.1f} KiB"
+            )
+    return regressions
+
+
+def parse_args():
+    """Parse the command-line options of the benchmark suite."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("cases", nargs="*", metavar="case",
+                        help="benchmarks to run (default: all); "
+                             f"choose from {', '.join(CASES)}")
+    parser.add_argument("--sizes", type=int, nargs="+",
+                        help="dataset sizes overriding the defaults")
+    parser.add_argument("--repeat", type=int, default=DEFAULT_REPEAT,
+                        help="timings per measurement (default: %(default)s)")
+    parser.add_argument("--min-time", type=float, default=MIN_RUN_TIME,
+                        help="minimum seconds per timing "
+                             "(default: %(default)s)")
+    parser.add_argument("--output", help="write the results to this JSON file")
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE,
+                        help="baseline JSON file (default: %(default)s)")
+    parser.add_argument("--threshold", type=float, default=0.25,
+                        help="tolerated relative regression "
+                             "(default: %(default)s)")
+    parser.add_argument("--memory-floor", type=int, default=MEMORY_FLOOR,
+                        help="tolerated peak memory growth in bytes "
+                             "(default: %(default)s)")
+    parser.add_argument("--require-baseline", action="store_true",
+                        help="fail when the baseline file is missing")
+    parser.add_argument("--update-baseline", action="store_true",
+                        help="store the results as the new baseline")
+    args = parser.parse_args()
+    unknown = [name for name in args.cases if name not in CASES]
+    if unknown:
+        parser.error(f"unknown case: {', '.join(unknown)}")
+    return args
+
+
+def main():
+    """Run the suite, record the results and check them for regressions."""
+    args = parse_args()
+
+    baseline = {}
+    if os.path.exists(args.baseline) and not args.update_baseline:
+        with open(args.baseline, encoding="utf-8") as stream:
+            baseline = json.load(stream)["results"]
+    elif not args.update_baseline:
+        if args.require_baseline:
+            print(f"No baseline found at {args.baseline}")
+            return 1
+        print(f"Warning: no baseline found at {args.baseline}; "
+              "results will not be checked for regressions")
+
+    print(f"{'benchmark':<42}{'ops/sec':>14}{'peak KiB':>12}{'vs base':>9}")
+    results = {}
+    for key, result in run_suite(args.cases or list(CASES),
+                                 args.sizes, args.repeat, args.min_time):
+        results[key] = result
+        change = ""
+        if key in baseline:
+            ratio = result["ops_per_sec"] / baseline[key]["ops_per_sec"]
+            change = f"{ratio - 1:+.0%}"
+        print(f"{key:<42}{result['ops_per_sec']:>14,.0f}"
+              f"{result['peak_bytes'] / 1024:>12,.1f}{change:>9}")
+
+    report = {
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "results": results
+    }
+    paths = [args.output, args.baseline if args.update_baseline else None]
+    for path in paths:
+        if path:
+            with open(path, "w", encoding="utf-8") as stream:
+                json.dump(report, stream, indent=2, sort_keys=True)
+            print(f"Results written to {path}")
+
+    regressions = find_regressions(results, baseline, args.threshold,
+                                   args.memory_floor)
+    if regressions:
+        print(f"\n{len(regressions)} regression(s) beyond "
+              f"{args.threshold:.0%}:")
+        for message in regressions:
+            print(f"  {message}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,367 @@
+#!/usr/bin/env python3
+"""Synthetic game dataset generator module.
+
+This module streams deterministic, seeded synthetic data for load-testing
+the exercise modules: player records with Zipf-distributed achievement
+sets, player inventories and clustered coordinate clouds. Records are
+generated lazily and can be written to disk as fixed-width binary files
+that are read back through mmap, so datasets of 10^3 to 10^8 records
+never have to be held in memory at once.
+
+File layout: a 32-byte header (magic, format version, dataset kind,
+record count) followed by little-endian fixed-width records.
+
+Example: python3 dataset_generator.py players 1000000 players.gtds
+"""
+import math
+import mmap
+import os
+import random
+import struct
+import sys
+
+MAGIC = b"GTDS"
+FORMAT_VERSION = 1
+HEADER = struct.Struct("<4sH14sQ4x")
+WRITE_BATCH = 65536
+READ_BATCH = 65536
+DEFAULT_SEED = 42
+ZIPF_EXPONENT = 1.1
+
+REGIONS = ("north", "east", "central", "south", "west")
+REGION_WEIGHTS = (30, 20, 25, 15, 10)
+CATEGORIES = ("weapon", "armor", "consumable", "accessory")
+RARITIES = ("common", "uncommon", "rare", "legendary")
+RARITY_VALUES = (50, 200, 500, 2000)
+ITEM_CATALOG_SIZE = 1000
+
+ACHIEVEMENTS = (
+    "level_10",
+    "first_kill",
+    "treasure_hunter",
+    "speed_demon",
+    "boss_slayer",
+    "collector",
+    "perfectionist"
+) + tuple(f"achievement_{i}" for i in range(7, 64))
+
+RECORD_FORMATS = {
+    # player_id, score, achievement count, active, region, achievement bits
+    "players": struct.Struct("<QiHBBQ"),
+    # player_id, item_id, category, rarity, quantity, value
+    "inventories": struct.Struct("<QIBBII"),
+    # x, y, z
+    "coordinates": struct.Struct("<iii")
+}
+
+
+def zipf_cum_weights(size, exponent=ZIPF_EXPONENT):
+    """Build cumulative Zipf weights for random.choices().
+
+    Args:
+        size: The number of ranks.
+        exponent: The Zipf exponent; larger values skew harder.
+
+    Returns:
+        list: The cumulative weight of ranks 1 to size.
+    """
+    cumulative = []
+    total = 0.0
+    for rank in range(1, size + 1):
+        total += 1 / rank ** exponent
+        cumulative.append(total)
+    return cumulative
+
+
+def player_name(player_id):
+    """Return the name used for a generated player id."""
+    return f"player_{player_id}"
+
+
+def generate_players(count, seed=DEFAULT_SEED):
+    """Lazily generate player records.
+
+    Scores are roughly normal around 1500, about 70% of the players are
+    active, and achievements are drawn from a Zipf distribution so a few
+    are very common and most are rare.
+
+    Args:
+        count: The number of players to generate.
+        seed: The random seed; the same seed yields the same records.
+
+    Yields:
+        tuple: (player_id, score, achievement_count, active, region_index,
+            achievement_bits), where bit i of achievement_bits stands for
+            ACHIEVEMENTS[i].
+    """
+    rng = random.Random(seed)
+    ranks = range(len(ACHIEVEMENTS))
+    achievement_weights = zipf_cum_weights(len(ACHIEVEMENTS))
+    region_indexes = range(len(REGIONS))
+    for player_id in range(count):
+        score = max(0, int(rng.gauss(1500, 500)))
+        active = rng.random() < 0.7
+        region = rng.choices(region_indexes, REGION_WEIGHTS)[0]
+        draws = rng.choices(
+            ranks, cum_weights=achievement_weights, k=rng.randint(1, 12)
+        )
+        bits = 0
+        for rank in draws:
+            bits |= 1 << rank
+        yield player_id, score, bin(bits).count("1"), active, region, bits
+
+
+def generate_inventories(players, max_items=8, seed=DEFAULT_SEED):
+    """Lazily generate inventory records, grouped by player.
+
+    Items are drawn from a Zipf-distributed catalog; rarer catalog items
+    have a higher rarity and value.
+
+    Args:
+        players: The number of players owning an inventory.
+        max_items: The maximum number of distinct items per player.
+        seed: The random seed; the same seed yields the same records.
+
+    Yields:
+        tuple: (player_id, item_id, category_index, rarity_index,
+            quantity, value).
+    """
+    rng = random.Random(seed)
+    catalog = range(ITEM_CATALOG_SIZE)
+    item_weights = zipf_cum_weights(ITEM_CATALOG_SIZE)
+    for player_id in range(players):
+        items = set(rng.choices(
+            catalog, cum_weights=item_weights, k=rng.randint(1, max_items)
+        ))
+        for item_id in sorted(items):
+            rarity = min(int(math.log10(item_id + 1)), len(RARITIES) - 1)
+            yield (
+                player_id,
+                item_id,
+                item_id % len(CATEGORIES),
+                rarity,
+                rng.randint(1, 10 if rarity == 0 else 2),
+                RARITY_VALUES[rarity]
+            )
+
+
+def generate_coordinates(count, clusters=16, spread=500, seed=DEFAULT_SEED):
+    """Lazily generate a clustered 3D coordinate cloud.
+
+    Args:
+        count: The number of points to generate.
+        clusters: The number of gaussian clusters.
+        spread: The standard deviation of each cluster.
+        seed: The random seed; the same seed yields the same records.
+
+    Yields:
+        tuple: (x, y, z) integer coordinates.
+    """
+    rng = random.Random(seed)
+    centers = [
+        tuple(rng.randint(-100000, 100000) for _ in range(3))
+        for _ in range(clusters)
+    ]
+    for _ in range(count):
+        x, y, z = rng.choice(centers)
+        yield (
+            int(rng.gauss(x, spread)),
+            int(rng.gauss(y, spread)),
+            int(rng.gauss(z, spread))
+        )
+
+
+GENERATORS = {
+    "players": generate_players,
+    "inventories": generate_inventories,
+    "coordinates": generate_coordinates
+}
+
+
+def write_dataset(path, kind, records):
+    """Write records to a dataset file in batches.
+
+    Args:
+        path: The output file path.
+        kind: A key of RECORD_FORMATS.
+        records: An iterable of record tuples matching that format.
+
+    Returns:
+        int: The number of records written.
+    """
+    pack = RECORD_FORMATS[kind].pack
+    count = 0
+    with open(path, "wb") as stream:
+        stream.write(HEADER.pack(MAGIC, FORMAT_VERSION, kind.encode(), 0))
+        batch = []
+        for record in records:
+            batch.append(pack(*record))
+            if len(batch) == WRITE_BATCH:
+                stream.write(b"".join(batch))
+                count += len(batch)
+                batch.clear()
+        stream.write(b"".join(batch))
+        count += len(batch)
+        stream.seek(0)
+        stream.write(HEADER.pack(MAGIC, FORMAT_VERSION, kind.encode(), count))
+    return count
+
+
+def dataset_info(path):
+    """Read the header of a dataset file.
+
+    Args:
+        path: The dataset file path.
+
+    Returns:
+        tuple: The dataset kind and its record count.
+
+    Raises:
+        ValueError: If the file is not a dataset of a known kind, or its
+            size does not match the record count of its header.
+    """
+    with open(path, "rb") as stream:
+        header = stream.read(HEADER.size)
+        size = os.fstat(stream.fileno()).st_size
+    if len(header) < HEADER.size:
+        raise ValueError(f"{path}: truncated dataset header")
+    magic, version, kind, count = HEADER.unpack(header)
+    kind = kind.rstrip(b"\0").decode()
+    if magic != MAGIC or version != FORMAT_VERSION:
+        raise ValueError(f"{path}: not a game dataset file")
+    if kind not in RECORD_FORMATS:
+        raise ValueError(f"{path}: unknown dataset kind {kind!r}")
+    if size != HEADER.size + count * RECORD_FORMATS[kind].size:
+        raise ValueError(
+            f"{path}: truncated or corrupt dataset "
+            f"({size} bytes for {count} {kind} records)"
+        )
+    return kind, count
+
+
+def iter_records(path, start=0, stop=None):
+    """Lazily read the records of a dataset file through mmap.
+
+    Args:
+        path: The dataset file path.
+        start: The index of the first record to read.
+        stop: The index after the last record to read, or None for all.
+
+    Yields:
+        tuple: Each record, as generated.
+    """
+    kind, count = dataset_info(path)
+    record = RECORD_FORMATS[kind]
+    stop = count if stop is None else min(stop, count)
+    if start >= stop:
+        return
+
+    with open(path, "rb") as stream:
+        with mmap.mmap(stream.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            for first in range(start, stop, READ_BATCH):
+                last = min(first + READ_BATCH, stop)
+                begin = HEADER.size + first * record.size
+                end = HEADER.size + last * record.size
+                yield from record.iter_unpack(data[begin:end])
+
+
+def dashboard_entry(record):
+    """Convert a player record to an ft_analytics_dashboard entry.
+
+    Args:
+        record: A tuple produced by generate_players().
+
+    Returns:
+        tuple: (name, data) where data has 'score', 'achievements',
+            'active' and 'region' keys.
+    """
+    player_id, score, achievements, active, region, _ = record
+    return player_name(player_id), {
+        "score": score,
+        "achievements": achievements,
+        "active": bool(active),
+        "region": REGIONS[region]
+    }
+
+
+def achievement_entry(record):
+    """Convert a player record to an ft_achievement_tracker entry.
+
+    Args:
+        record: A tuple produced by generate_players().
+
+    Returns:
+        tuple: (name, achievements) where achievements is a set of names.
+    """
+    player_id, bits = record[0], record[5]
+    return player_name(player_id), {
+        name for rank, name in enumerate(ACHIEVEMENTS) if bits >> rank & 1
+    }
+
+
+def iter_inventories(records):
+    """Group inventory records into ft_inventory_system inventories.
+
+    Args:
+        records: Inventory record tuples, grouped by player id.
+
+    Yields:
+        tuple: (name, inventory) for each player, where inventory maps
+            item names to 'category', 'rarity', 'quantity' and 'value'.
+    """
+    current = None
+    inventory = {}
+    for player_id, item_id, category, rarity, quantity, value in records:
+        if player_id != current:
+            if current is not None:
+                yield player_name(current), inventory
+            current = player_id
+            inventory = {}
+        inventory[f"item_{item_id}"] = {
+            "category": CATEGORIES[category],
+            "rarity": RARITIES[rarity],
+            "quantity": quantity,
+            "value": value
+        }
+    if current is not None:
+        yield player_name(current), inventory
+
+
+def main():
+    """Generate a dataset file from the command line.
+
+    For the inventories kind, count is the number of players whose
+    inventories are generated.
+    """
+    args = sys.argv[1:]
+    seed = DEFAULT_SEED
+    if len(args) == 5 and args[3] == "--seed":
+        try:
+            seed = int(args[4])
+        except ValueError:
+            args = []
+        else:
+            args = args[:3]
+
+    count = -1
+    if len(args) == 3:
+        try:
+            count = int(args[1])
+        except ValueError:
+            pass
+    if count < 0 or args[0] not in GENERATORS:
+        print("Usage: python3 dataset_generator.py "
+              f"<{'|'.join(GENERATORS)}> <count> <path> [--seed N]")
+        return
+
+    kind, path = args[0], args[2]
+    try:
+        written = write_dataset(path, kind, GENERATORS[kind](count, seed=seed))
+    except OSError as error:
+        print(f"Cannot write dataset: {error}")
+        return
+    print(f"Wrote {written} {kind} records to {path}")
+
+
+if __name__ == "__main__":
+    main()
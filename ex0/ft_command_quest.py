@@ -2,9 +2,81 @@
 
 This module demonstrates how to access and manipulate command-line arguments
 using sys.argv in Python.
+
+Arguments can also be streamed from @argfile files or from stdin (one
+argument per line), which avoids the OS limit on command-line length, and
+are written out in batches through a single buffer.
 """
 import sys
 
+OUTPUT_BATCH_SIZE = 4096
+
+
+def iter_argfile(path):
+    """Lazily yield the arguments stored in a file, one per line.
+
+    Args:
+        path: The path of the argument file.
+
+    Yields:
+        str: Each line of the file without its line ending.
+    """
+    with open(path, encoding="utf-8") as argfile:
+        for line in argfile:
+            yield line.rstrip("\r\n")
+
+
+def iter_arguments(args, stdin=None):
+    """Lazily yield the arguments, expanding @argfile entries in place.
+
+    Args:
+        args: The command-line arguments, without the program name.
+        stdin: A text stream to read the arguments from, one per line,
+            instead of args.
+
+    Yields:
+        str: Each argument in order.
+    """
+    if stdin is not None:
+        for line in stdin:
+            yield line.rstrip("\r\n")
+        return
+
+    for arg in args:
+        if arg.startswith("@") and len(arg) > 1:
+            yield from iter_argfile(arg[1:])
+        else:
+            yield arg
+
+
+def write_arguments(arguments, out, batch_size=OUTPUT_BATCH_SIZE):
+    """Write one line per argument, batching the writes.
+
+    Args:
+        arguments: An iterable of arguments.
+        out: A text stream to write to.
+        batch_size: The number of lines to group in a single write.
+
+    Returns:
+        int: The number of arguments written.
+
+    Note:
+        The lines already batched are still written if reading the
+        arguments fails partway through.
+    """
+    count = 0
+    batch = []
+    try:
+        for count, arg in enumerate(arguments, 1):
+            batch.append(f"Argument {count}: {arg}\n")
+            if len(batch) == batch_size:
+                out.write("".join(batch))
+                batch.clear()
+    finally:
+        if batch:
+            out.write("".join(batch))
+    return count
+
 
 def main():
     """Process and display command-line arguments received.
@@ -13,6 +85,12 @@ def main():
     number of arguments received,
     and each argument individually.
     If no arguments are provided, displays a message indicating so.
+
+    Note:
+        An argument of the form @path is replaced by the lines of that
+        file, and --stdin reads the arguments from stdin instead. As the
+        arguments are streamed, their count is then shown after them.
+        Example: python3 ft_command_quest.py @args.txt
     """
     print("=== Command Quest ===")
 
@@ -27,14 +105,24 @@ def main():
         return
 
     print(f"Program name: {program_name}")
-    print(f"Arguments received: {total_args - 1}")
 
-    i = 1
-    while i < total_args:
-        print(f"Argument {i}: {args[i]}")
-        i += 1
+    streaming = args[1:] == ["--stdin"] or any(
+        arg.startswith("@") and len(arg) > 1 for arg in args[1:]
+    )
+    if not streaming:
+        print(f"Arguments received: {total_args - 1}")
+
+    stdin = sys.stdin if args[1:] == ["--stdin"] else None
+    sys.stdout.flush()
+    try:
+        received = write_arguments(iter_arguments(args[1:], stdin), sys.stdout)
+    except (OSError, UnicodeDecodeError) as error:
+        print(f"Cannot read arguments: {error}")
+        return
 
-    print(f"Total arguments: {total_args}")
+    if streaming:
+        print(f"Arguments received: {received}")
+    print(f"Total arguments: {received + 1}")
 
 
 if __name__ == "__main__":
@@ -2,8 +2,605 @@
 
 This module provides functionality to analyze player score statistics,
 including total, average, maximum, minimum, and score range.
+
+Statistics are gathered by a single-pass accumulator that can also read
+scores from stdin or from a file in large chunks, merge partial results
+computed elsewhere, and estimate percentiles with a small t-digest sketch,
+all in constant memory.
 """
+import math
 import sys
+from array import array
+
+CHUNK_SIZE = 1 << 20
+DIGEST_COMPRESSION = 100
+DIGEST_BUFFER_LIMIT = 50000
+REPORTED_PERCENTILES = (50, 90, 99)
+MAX_REPORTED_ERRORS = 10
+MAX_TOKEN_SIZE = CHUNK_SIZE
+SEPARATORS = (b"\n", b" ", b"\t", b",", b"\r", b"\x0b", b"\x0c")
+
+
+def new_digest(compression=DIGEST_COMPRESSION):
+    """Create an empty t-digest sketch for approximate percentiles.
+
+    Args:
+        compression: Accuracy knob; higher values keep more centroids.
+
+    Returns:
+        dict: The sketch state, with 'compression', 'centroids' (a sorted
+            list of [mean, weight] pairs), 'buffer' and 'count' keys.
+    """
+    return {
+        "compression": compression,
+        "centroids": [],
+        "buffer": [],
+        "count": 0
+    }
+
+
+def _merge_centroids(items, total, compression):
+    """Greedily merge sorted [mean, weight] pairs under the t-digest limit.
+
+    A centroid may only grow while its weight stays under
+    4 * n * q * (1 - q) / compression, which keeps the tails precise and
+    the number of centroids bounded.
+    """
+    merged = []
+    cumulative = 0
+    current_mean, current_weight = items[0]
+    for mean, weight in items[1:]:
+        q = (cumulative + current_weight + weight / 2) / total
+        limit = 4 * total * q * (1 - q) / compression
+        if current_weight + weight <= limit:
+            current_weight += weight
+            current_mean += (mean - current_mean) * weight / current_weight
+        else:
+            merged.append([current_mean, current_weight])
+            cumulative += current_weight
+            current_mean, current_weight = mean, weight
+    merged.append([current_mean, current_weight])
+    return merged
+
+
+def compress_digest(digest):
+    """Fold buffered values into the digest centroids.
+
+    Args:
+        digest: A sketch created by new_digest().
+    """
+    if not digest["buffer"]:
+        return
+
+    digest["buffer"].sort()
+    items = digest["centroids"] + [[value, 1] for value in digest["buffer"]]
+    items.sort(key=lambda centroid: centroid[0])
+    digest["centroids"] = _merge_centroids(
+        items, digest["count"], digest["compression"]
+    )
+    digest["buffer"] = []
+
+
+def add_to_digest(digest, values):
+    """Add a batch of values to a digest.
+
+    Args:
+        digest: A sketch created by new_digest().
+        values: A sequence of numeric values.
+    """
+    digest["buffer"].extend(values)
+    digest["count"] += len(values)
+    if len(digest["buffer"]) >= DIGEST_BUFFER_LIMIT:
+        compress_digest(digest)
+
+
+def merge_digests(digest1, digest2):
+    """Combine two digests into a new one.
+
+    Args:
+        digest1: A sketch created by new_digest().
+        digest2: A sketch created by new_digest().
+
+    Returns:
+        dict: A new sketch summarizing the values of both inputs.
+    """
+    merged = new_digest(max(digest1["compression"], digest2["compression"]))
+    merged["count"] = digest1["count"] + digest2["count"]
+    items = (
+        digest1["centroids"] + digest2["centroids"]
+        + [[value, 1] for value in digest1["buffer"]]
+        + [[value, 1] for value in digest2["buffer"]]
+    )
+    if items:
+        items.sort(key=lambda centroid: centroid[0])
+        merged["centroids"] = _merge_centroids(
+            items, merged["count"], merged["compression"]
+        )
+    return merged
+
+
+def digest_quantile(digest, q):
+    """Estimate the value at quantile q.
+
+    Args:
+        digest: A sketch created by new_digest().
+        q: The quantile to estimate, between 0 and 1.
+
+    Returns:
+        float: The estimated value, or None if the digest is empty.
+    """
+    compress_digest(digest)
+    centroids = digest["centroids"]
+    if not centroids:
+        return None
+    if len(centroids) == 1:
+        return float(centroids[0][0])
+
+    target = q * digest["count"]
+    cumulative = 0
+    previous_center = None
+    previous_mean = None
+    for mean, weight in centroids:
+        center = cumulative + weight / 2
+        if target <= center:
+            if previous_center is None:
+                return float(mean)
+            span = center - previous_center
+            fraction = (target - previous_center) / span
+            return previous_mean + (mean - previous_mean) * fraction
+        previous_center = center
+        previous_mean = mean
+        cumulative += weight
+    return float(centroids[-1][0])
+
+
+def parse_int_tokens(tokens, report_all=False):
+    """Convert a sequence of tokens into a compact integer array.
+
+    The tokens are first converted with a single map() into an
+    array('q'); they are only revisited one by one when that fails,
+    either on an invalid token or on a value outside the signed 64-bit
+    range. The per-token int() calls still dominate the run time, so
+    the gain over a plain loop is memory (8 bytes per value) rather
+    than speed.
+
+    Args:
+        tokens: A sequence of str or bytes tokens.
+        report_all: Whether to keep going after the first invalid token.
+
+    Returns:
+        tuple: A tuple containing:
+            - An array('q') of the valid values, or a list of ints if
+              one of them does not fit in 64 bits (only the values
+              before the first invalid token unless report_all is set)
+            - A list of (token_index, token) pairs for invalid tokens
+    """
+    try:
+        return array("q", map(int, tokens)), []
+    except (ValueError, OverflowError):
+        pass
+
+    values = array("q")
+    errors = []
+    for index, token in enumerate(tokens):
+        try:
+            value = int(token)
+        except ValueError:
+            errors.append((index, token))
+            if not report_all:
+                break
+            continue
+        try:
+            values.append(value)
+        except OverflowError:
+            values = values.tolist()
+            values.append(value)
+    return values, errors
+
+
+def parse_int_buffer(buffer, report_all=False):
+    """Parse whitespace- or comma-separated integers from a bytes buffer.
+
+    Args:
+        buffer: A bytes-like object, e.g. b"1500, 2300 1800".
+        report_all: Whether to keep going after the first invalid token.
+
+    Returns:
+        tuple: A tuple containing:
+            - The valid values, as returned by parse_int_tokens()
+            - A list of (token_index, byte_offset, token) triples for
+              invalid tokens
+    """
+    separated = bytes(buffer)
+    if b"," in separated:
+        separated = separated.replace(b",", b" ")
+    tokens = separated.split()
+    values, errors = parse_int_tokens(tokens, report_all)
+    if not errors:
+        return values, []
+
+    located = []
+    position = 0
+    for index, token in enumerate(tokens[:errors[-1][0] + 1]):
+        position = separated.find(token, position)
+        if index == errors[len(located)][0]:
+            located.append((index, position, token))
+        position += len(token)
+    return values, located
+
+
+def new_stats(percentiles=False):
+    """Create an empty score statistics accumulator.
+
+    Args:
+        percentiles: Whether to also track a t-digest for percentiles.
+
+    Returns:
+        dict: The accumulator state, with 'count', 'total', 'min', 'max',
+            'mean', 'm2' and 'digest' keys.
+    """
+    return {
+        "count": 0,
+        "total": 0,
+        "min": None,
+        "max": None,
+        "mean": 0.0,
+        "m2": 0.0,
+        "digest": new_digest() if percentiles else None
+    }
+
+
+def _combine_moments(stats, count, mean, m2):
+    """Fold a (count, mean, m2) partial into stats (Chan et al. update)."""
+    combined = stats["count"] + count
+    delta = mean - stats["mean"]
+    stats["mean"] += delta * count / combined
+    stats["m2"] += m2 + delta * delta * stats["count"] * count / combined
+    stats["count"] = combined
+
+
+def update_stats(stats, scores):
+    """Add a batch of scores to a statistics accumulator.
+
+    The batch moments are computed exactly with integer arithmetic and then
+    folded into the running Welford mean and variance.
+
+    Args:
+        stats: An accumulator created by new_stats().
+        scores: A sequence of integer scores.
+    """
+    count = len(scores)
+    if count == 0:
+        return
+
+    total = sum(scores)
+    squares = sum(score * score for score in scores)
+    low = min(scores)
+    high = max(scores)
+
+    stats["total"] += total
+    if stats["min"] is None or low < stats["min"]:
+        stats["min"] = low
+    if stats["max"] is None or high > stats["max"]:
+        stats["max"] = high
+    _combine_moments(
+        stats, count, total / count, (count * squares - total * total) / count
+    )
+    if stats["digest"] is not None:
+        add_to_digest(stats["digest"], scores)
+
+
+def merge_stats(stats1, stats2):
+    """Merge two partial accumulators into a new one.
+
+    Args:
+        stats1: An accumulator created by new_stats().
+        stats2: An accumulator created by new_stats().
+
+    Returns:
+        dict: A new accumulator equivalent to having seen both inputs.
+    """
+    percentiles = (
+        stats1["digest"] is not None and stats2["digest"] is not None
+    )
+    merged = new_stats()
+    for stats in (stats1, stats2):
+        if stats["count"] == 0:
+            continue
+        merged["total"] += stats["total"]
+        if merged["min"] is None or stats["min"] < merged["min"]:
+            merged["min"] = stats["min"]
+        if merged["max"] is None or stats["max"] > merged["max"]:
+            merged["max"] = stats["max"]
+        _combine_moments(merged, stats["count"], stats["mean"], stats["m2"])
+    if percentiles:
+        merged["digest"] = merge_digests(stats1["digest"], stats2["digest"])
+    return merged
+
+
+def stats_variance(stats):
+    """Return the population variance of the accumulated scores.
+
+    Args:
+        stats: An accumulator created by new_stats().
+
+    Returns:
+        float: The variance, or 0.0 when no scores were seen.
+    """
+    if stats["count"] == 0:
+        return 0.0
+    return stats["m2"] / stats["count"]
+
+
+def _last_separator(data):
+    """Return the offset of the last separator byte in data, or -1."""
+    return max(data.rfind(separator) for separator in SEPARATORS)
+
+
+def _first_separator(data):
+    """Return the offset of the first separator byte in data, or -1."""
+    found = [
+        offset for offset in map(data.find, SEPARATORS) if offset != -1
+    ]
+    return min(found, default=-1)
+
+
+def _clip_token(token):
+    """Cut a partial token short once it exceeds MAX_TOKEN_SIZE."""
+    if len(token) > MAX_TOKEN_SIZE:
+        return token[:MAX_TOKEN_SIZE] + b"..."
+    return token
+
+
+def read_token_blocks(stream, limit=None, chunk_size=CHUNK_SIZE):
+    """Read a stream of separated scores in blocks of whole tokens.
+
+    Blocks are cut after the last whitespace or comma of each chunk, so
+    input without newlines is read in bounded memory too. No score is
+    longer than MAX_TOKEN_SIZE bytes: longer tokens are cut short and
+    end with b"...", so that they are still reported as invalid.
+
+    Args:
+        stream: A binary file object, such as sys.stdin.buffer.
+        limit: The maximum number of bytes to read, or None for all.
+        chunk_size: The number of bytes to read at a time, at most
+            MAX_TOKEN_SIZE.
+
+    Yields:
+        bytes: A block made of complete tokens and their separators (the
+            last block of the stream may lack a trailing separator).
+    """
+    pending = b""
+    remaining = limit
+    while remaining is None or remaining > 0:
+        size = chunk_size if remaining is None else min(chunk_size, remaining)
+        chunk = stream.read(size)
+        if not chunk:
+            break
+        if remaining is not None:
+            remaining -= len(chunk)
+        if pending:
+            end = _first_separator(chunk)
+            if end == -1:
+                end = len(chunk)
+            if len(pending) <= MAX_TOKEN_SIZE:
+                pending = _clip_token(pending + chunk[:end])
+            chunk = chunk[end:]
+            if not chunk:
+                continue
+        cut = _last_separator(chunk)
+        if cut == -1:
+            pending = _clip_token(chunk)
+        else:
+            yield pending + chunk[:cut + 1]
+            pending = _clip_token(chunk[cut + 1:])
+    if pending:
+        yield pending
+
+
+def parse_score_block(block, first_line, max_errors=MAX_REPORTED_ERRORS):
+    """Parse a block of lines, collecting invalid scores instead of failing.
+
+    Line numbers are only worked out for the first max_errors invalid
+    scores; the others are just counted.
+
+    Args:
+        block: Bytes holding whole whitespace- or comma-separated
+            scores.
+        first_line: The 1-based line number at the start of block.
+        max_errors: The number of invalid scores to locate.
+
+    Returns:
+        tuple: A tuple containing:
+            - An array('q') of the valid scores
+            - The number of invalid scores
+            - Up to max_errors (line_number, token) pairs
+    """
+    scores, errors = parse_int_buffer(block, report_all=True)
+    located = []
+    line = first_line
+    position = 0
+    for _, offset, token in errors[:max(max_errors, 0)]:
+        line += block.count(b"\n", position, offset)
+        position = offset
+        located.append((line, token.decode(errors="replace")))
+    return scores, len(errors), located
+
+
+def scan_scores(stream, stats, limit=None):
+    """Feed every score of a separated stream into an accumulator.
+
+    Args:
+        stream: A binary file object positioned at the start of a token.
+        stats: An accumulator created by new_stats().
+        limit: The maximum number of bytes to read, or None for all.
+
+    Returns:
+        tuple: A tuple containing:
+            - The number of newlines read
+            - The number of invalid scores found
+            - Up to MAX_REPORTED_ERRORS (line_number, token) pairs,
+              with line numbers relative to the start of the scan
+    """
+    lines = 0
+    error_count = 0
+    errors = []
+    for block in read_token_blocks(stream, limit):
+        scores, block_count, block_errors = parse_score_block(
+            block, lines + 1, MAX_REPORTED_ERRORS - len(errors)
+        )
+        update_stats(stats, scores)
+        error_count += block_count
+        errors.extend(block_errors)
+        lines += block.count(b"\n")
+    return lines, error_count, errors
+
+
+def _skip_token(stream, chunk_size=1 << 16):
+    """Advance a stream past the next separator and return its offset."""
+    while True:
+        start = stream.tell()
+        chunk = stream.read(chunk_size)
+        if not chunk:
+            return start
+        end = _first_separator(chunk)
+        if end != -1:
+            return start + end + 1
+
+
+def split_token_ranges(path, parts):
+    """Split a file into byte ranges that start and end between tokens.
+
+    Args:
+        path: The path of a file of separated scores.
+        parts: The desired number of ranges.
+
+    Returns:
+        list: (start, end) byte offsets; empty ranges are dropped.
+    """
+    with open(path, "rb") as stream:
+        stream.seek(0, 2)
+        size = stream.tell()
+        boundaries = [0]
+        for part in range(1, parts):
+            stream.seek(max(size * part // parts - 1, boundaries[-1]))
+            boundaries.append(max(_skip_token(stream), boundaries[-1]))
+        boundaries.append(size)
+
+    return [
+        (start, end)
+        for start, end in zip(boundaries, boundaries[1:])
+        if end > start
+    ]
+
+
+def analyze_range(task):
+    """Aggregate the scores in one byte range of a file.
+
+    Args:
+        task: A tuple (path, start, end, percentiles).
+
+    Returns:
+        tuple: (stats, lines, error_count, errors) as returned by
+            scan_scores(), together with the partial accumulator.
+    """
+    path, start, end, percentiles = task
+    stats = new_stats(percentiles)
+    with open(path, "rb") as stream:
+        stream.seek(start)
+        lines, error_count, errors = scan_scores(stream, stats, end - start)
+    return stats, lines, error_count, errors
+
+
+def analyze_file(path, workers=1, percentiles=False):
+    """Aggregate a score file, optionally across several processes.
+
+    Each worker handles one byte range cut between tokens; the partial
+    accumulators are merged and the error line numbers are shifted by
+    the newlines of the preceding ranges.
+
+    Args:
+        path: The path of a file of separated scores.
+        workers: The number of worker processes to use.
+        percentiles: Whether to also track approximate percentiles.
+
+    Returns:
+        tuple: (stats, error_count, errors) for the whole file.
+    """
+    tasks = [
+        (path, start, end, percentiles)
+        for start, end in split_token_ranges(path, workers)
+    ]
+    if workers > 1 and len(tasks) > 1:
+        import multiprocessing
+
+        with multiprocessing.Pool(min(workers, len(tasks))) as pool:
+            partials = pool.map(analyze_range, tasks)
+    else:
+        partials = [analyze_range(task) for task in tasks]
+
+    stats = new_stats(percentiles)
+    line_offset = 0
+    error_count = 0
+    errors = []
+    for partial, lines, partial_count, partial_errors in partials:
+        stats = merge_stats(stats, partial)
+        error_count += partial_count
+        for line, token in partial_errors[:MAX_REPORTED_ERRORS - len(errors)]:
+            errors.append((line_offset + line, token))
+        line_offset += lines
+    return stats, error_count, errors
+
+
+def print_stats(stats):
+    """Print the summary lines shared by every input mode.
+
+    Args:
+        stats: A non-empty accumulator created by new_stats().
+    """
+    print(f"Total players: {stats['count']}")
+    print(f"Total score: {stats['total']}")
+    print(f"Average score: {stats['mean']:.1f}")
+    print(f"Highest score: {stats['max']}")
+    print(f"Lowest score: {stats['min']}")
+    print(f"Score range: {stats['max'] - stats['min']}")
+
+
+def print_percentiles(stats):
+    """Print the approximate percentiles tracked by an accumulator.
+
+    Args:
+        stats: A non-empty accumulator created by new_stats(True).
+    """
+    for percentile in REPORTED_PERCENTILES:
+        value = digest_quantile(stats["digest"], percentile / 100)
+        print(f"Score p{percentile} (approx.): {value:.1f}")
+
+
+def print_report(stats, error_count, errors, percentiles):
+    """Print the report for the --stdin and --file modes.
+
+    Args:
+        stats: The accumulator holding every valid score.
+        error_count: The number of invalid scores that were skipped.
+        errors: (line_number, token) pairs for the first invalid scores.
+        percentiles: Whether to also report approximate percentiles.
+    """
+    if error_count:
+        print(f"Invalid scores skipped: {error_count}")
+        for line, token in errors:
+            print(f"  line {line}: {token!r}")
+        if error_count > len(errors):
+            print(f"  ... and {error_count - len(errors)} more")
+
+    if stats["count"] == 0:
+        print("No valid scores provided.")
+        return
+
+    print_stats(stats)
+    print(f"Score std deviation: {math.sqrt(stats_variance(stats)):.1f}")
+    if percentiles:
+        print_percentiles(stats)
 
 
 def main():
@@ -18,10 +615,46 @@ def main():
     Note:
         Scores must be provided as command-line arguments.
         Example: python3 ft_score_analytics.py 1500 2300 1800
+        Large score dumps can be streamed instead with
+        --stdin or --file <path> [--workers N]; add --percentiles
+        for approximate median and tail percentiles. In these modes
+        invalid scores are reported by line number and skipped.
     """
 
     print("=== Player Score Analytics ===")
     args = sys.argv[1:]
+
+    percentiles = "--percentiles" in args
+    if percentiles:
+        args = [arg for arg in args if arg != "--percentiles"]
+
+    if args and args[0] == "--stdin":
+        stats = new_stats(percentiles)
+        _, error_count, errors = scan_scores(sys.stdin.buffer, stats)
+        print_report(stats, error_count, errors, percentiles)
+        return
+
+    if args and args[0] == "--file":
+        workers = 1
+        if len(args) == 4 and args[2] == "--workers":
+            try:
+                workers = int(args[3])
+            except ValueError:
+                workers = 0
+        if len(args) not in (2, 4) or workers < 1:
+            print("Usage: python3 ft_score_analytics.py "
+                  "--file <path> [--workers N]")
+            return
+        try:
+            stats, error_count, errors = analyze_file(
+                args[1], workers, percentiles
+            )
+        except OSError as error:
+            print(f"Cannot read scores: {error}")
+            return
+        print_report(stats, error_count, errors, percentiles)
+        return
+
     total_args = len(args)
 
     if total_args == 0:
@@ -29,31 +662,21 @@ def main():
               "Usage: python3 ft_score_analytics.py <score1> <score2> ...")
         return
 
-    scores = []
-    for value in args:
-        try:
-            scores.append(int(value))
-        except ValueError:
-            print(f"Invalid score detected: {value}")
-            print("Please enter only numeric values.")
-            print("Example: python3 ft_score_analytics.py "
-                  "1500 2300 1800 2100 1950")
-            return
+    scores, errors = parse_int_tokens(args)
+    if errors:
+        print(f"Invalid score detected: {errors[0][1]}")
+        print("Please enter only numeric values.")
+        print("Example: python3 ft_score_analytics.py "
+              "1500 2300 1800 2100 1950")
+        return
+
+    stats = new_stats(percentiles)
+    update_stats(stats, scores)
 
-    total_players = len(scores)
-    total_score = sum(scores)
-    average_score = total_score / total_players
-    highest_score = max(scores)
-    lowest_score = min(scores)
-    score_range = highest_score - lowest_score
-
-    print(f"Scores processed: {scores}")
-    print(f"Total players: {total_players}")
-    print(f"Total score: {total_score}")
-    print(f"Average score: {average_score:.1f}")
-    print(f"Highest score: {highest_score}")
-    print(f"Lowest score: {lowest_score}")
-    print(f"Score range: {score_range}")
+    print(f"Scores processed: {list(scores)}")
+    print_stats(stats)
+    if percentiles:
+        print_percentiles(stats)
 
 
 if __name__ == "__main__":
@@ -3,6 +3,7 @@
 This module demonstrates the use of generators for efficient data streaming
 and processing, including game events, Fibonacci sequences, and prime numbers.
 """
+import time
 
 
 def game_event_stream(total_events):
@@ -85,6 +86,7 @@ def main():
     high_level_players = 0
     treasure_events = 0
     level_up_events = 0
+    start_time = time.perf_counter()
 
     for player, level, action in game_event_stream(total_events):
         total_processed += 1
@@ -102,6 +104,7 @@ def main():
         if action == "leveled up":
             level_up_events += 1
 
+    elapsed = time.perf_counter() - start_time
     print("...")
     print("\n=== Stream Analytics ===")
     print(f"Total events processed: {total_processed}")
@@ -109,7 +112,7 @@ def main():
     print(f"Treasure events: {treasure_events}")
     print(f"Level-up events: {level_up_events}")
     print("\nMemory usage: Constant (streaming)")
-    print("Processing time: 0.045 seconds")
+    print(f"Processing time: {elapsed:.3f} seconds")
 
     print("\n=== Generator Demonstration ===")
 
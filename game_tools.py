@@ -0,0 +1,318 @@
+#!/usr/bin/env python3
+"""Unified game-tools command-line entry point.
+
+This module dispatches subcommands to the main() function of each exercise
+module, importing a module only when its subcommand runs. It can also run
+as a server that keeps every module imported and serves repeated calls over
+a local Unix socket.
+
+Example:
+    python3 game_tools.py scores 1500 2300 1800
+    python3 game_tools.py serve /tmp/game-tools.sock &
+    python3 game_tools.py --connect /tmp/game-tools.sock scores 1500 2300
+"""
+import sys
+
+PROGRAM_NAME = "game-tools"
+REQUEST_TIMEOUT = 10
+MAX_REQUEST_SIZE = 1 << 20
+POLL_INTERVAL = 0.5
+
+COMMANDS = {
+    "quest": "ex0.ft_command_quest",
+    "scores": "ex1.ft_score_analytics",
+    "coords": "ex2.ft_coordinate_system",
+    "achievements": "ex3.ft_achievement_tracker",
+    "inventory": "ex4.ft_inventory_system",
+    "stream": "ex5.ft_data_stream",
+    "dashboard": "ex6.ft_analytics_dashboard"
+}
+
+
+def print_usage():
+    """Print the list of subcommands and modes."""
+    print(f"Usage: {PROGRAM_NAME} <command> [args...]")
+    print(f"       {PROGRAM_NAME} serve <socket>")
+    print(f"       {PROGRAM_NAME} --connect <socket> <command> [args...]")
+    print(f"Commands: {', '.join(COMMANDS)}")
+
+
+def load_command(command):
+    """Import the module of a subcommand, if not already imported.
+
+    __import__ is used rather than importlib.import_module() so that the
+    import shows up in -X importtime reports.
+
+    Args:
+        command: A key of COMMANDS.
+
+    Returns:
+        module: The imported exercise module.
+    """
+    return __import__(COMMANDS[command], fromlist=["main"])
+
+
+def run_command(command, args):
+    """Import a subcommand's module if needed and run its main().
+
+    Args:
+        command: A key of COMMANDS.
+        args: The arguments passed to the subcommand.
+    """
+    module = load_command(command)
+    saved_argv = sys.argv
+    sys.argv = [f"{PROGRAM_NAME} {command}"] + list(args)
+    try:
+        module.main()
+    finally:
+        sys.argv = saved_argv
+
+
+def handle_request(argv, cwd=None):
+    """Run one server request and capture everything it prints.
+
+    Args:
+        argv: The subcommand followed by its arguments.
+        cwd: The client's working directory, against which the
+            subcommand resolves relative paths, or None.
+
+    Returns:
+        tuple: A tuple containing:
+            - The exit status (0 on success)
+            - The captured standard output and error text
+    """
+    import contextlib
+    import io
+    import os
+    import traceback
+
+    output = io.StringIO()
+    status = 0
+    with contextlib.redirect_stdout(output), \
+            contextlib.redirect_stderr(output):
+        saved_stdin = sys.stdin
+        saved_cwd = os.getcwd()
+        sys.stdin = io.TextIOWrapper(io.BytesIO())
+        try:
+            if cwd is not None:
+                os.chdir(cwd)
+            if not argv or argv[0] not in COMMANDS:
+                print_usage()
+                status = 2
+            else:
+                run_command(argv[0], argv[1:])
+        except SystemExit as error:
+            status = error.code if isinstance(error.code, int) else 1
+        except OSError as error:
+            print(f"Cannot run command: {error}")
+            status = 1
+        except Exception:
+            traceback.print_exc()
+            status = 1
+        finally:
+            sys.stdin = saved_stdin
+            os.chdir(saved_cwd)
+    return status, output.getvalue()
+
+
+def parse_request(line):
+    """Decode and validate one request line sent to the server.
+
+    Args:
+        line: The raw request line.
+
+    Returns:
+        tuple: The argv list and the client's working directory (or
+            None).
+
+    Raises:
+        ValueError: If the line is not a valid request.
+    """
+    import json
+
+    request = json.loads(line)
+    if not isinstance(request, dict):
+        raise ValueError("request must be a JSON object")
+    argv = request.get("argv")
+    cwd = request.get("cwd")
+    if not isinstance(argv, list) or not all(
+        isinstance(arg, str) for arg in argv
+    ):
+        raise ValueError("'argv' must be a list of strings")
+    if cwd is not None and not isinstance(cwd, str):
+        raise ValueError("'cwd' must be a string")
+    return argv, cwd
+
+
+def claim_socket_path(socket_path):
+    """Make sure a server may listen on a path.
+
+    A leftover socket from a server that is no longer running is
+    removed; anything else at that path is left alone.
+
+    Args:
+        socket_path: The filesystem path of the socket.
+
+    Returns:
+        str: Why the path cannot be used, or None if it is free.
+    """
+    import os
+    import socket
+    import stat
+
+    try:
+        mode = os.lstat(socket_path).st_mode
+    except FileNotFoundError:
+        return None
+    if not stat.S_ISSOCK(mode):
+        return f"{socket_path} exists and is not a socket"
+
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as probe:
+        try:
+            probe.connect(socket_path)
+        except ConnectionRefusedError:
+            os.unlink(socket_path)
+            return None
+        except OSError as error:
+            return f"cannot check {socket_path}: {error}"
+    return f"a server is already listening on {socket_path}"
+
+
+def serve(socket_path):
+    """Keep every module imported and serve calls over a Unix socket.
+
+    Each connection sends one JSON line {"argv": [...], "cwd": ...} and
+    receives one JSON line {"status": ..., "output": ...}. Relative paths
+    in a call are resolved against the client's working directory, as
+    in a cold run. Requests are handled one at a time because the
+    modules print to the process-wide sys.stdout and the working
+    directory is process-wide too, so a client that does not send its
+    request within REQUEST_TIMEOUT seconds is dropped. Subcommands see
+    an empty stdin. SIGTERM lets the current request finish, then stops
+    the server.
+
+    Args:
+        socket_path: The filesystem path of the socket to listen on.
+
+    Returns:
+        int: The exit status (1 if the path cannot be used).
+    """
+    import json
+    import os
+    import signal
+    import socket
+    import socketserver
+
+    problem = claim_socket_path(socket_path)
+    if problem is not None:
+        print(f"Cannot serve: {problem}")
+        return 1
+
+    for command in COMMANDS:
+        load_command(command)
+    stopping = []
+    signal.signal(signal.SIGTERM, lambda signum, frame: stopping.append(1))
+
+    class RequestHandler(socketserver.StreamRequestHandler):
+        """Run the subcommand sent over one connection."""
+
+        timeout = REQUEST_TIMEOUT
+
+        def handle(self):
+            try:
+                line = self.rfile.readline(MAX_REQUEST_SIZE)
+            except socket.timeout:
+                status, output = 2, "Bad request: timed out\n"
+            else:
+                if not line:
+                    return
+                try:
+                    argv, cwd = parse_request(line)
+                except ValueError as error:
+                    status, output = 2, f"Bad request: {error}\n"
+                else:
+                    status, output = handle_request(argv, cwd)
+            response = {"status": status, "output": output}
+            try:
+                self.wfile.write(json.dumps(response).encode() + b"\n")
+            except OSError:
+                pass
+
+    with socketserver.UnixStreamServer(socket_path, RequestHandler) as server:
+        server.timeout = POLL_INTERVAL
+        inode = os.lstat(socket_path).st_ino
+        print(f"{PROGRAM_NAME} serving on {socket_path}", flush=True)
+        try:
+            while not stopping:
+                server.handle_request()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            try:
+                if os.lstat(socket_path).st_ino == inode:
+                    os.unlink(socket_path)
+            except FileNotFoundError:
+                pass
+    return 0
+
+
+def call_server(socket_path, argv):
+    """Send one call to a running server.
+
+    Args:
+        socket_path: The socket the server listens on.
+        argv: The subcommand followed by its arguments.
+
+    Returns:
+        tuple: The exit status and the output of the call.
+
+    Raises:
+        OSError: If the server cannot be reached.
+        ValueError: If the server's reply is not a valid response.
+    """
+    import json
+    import os
+    import socket
+
+    request = {"argv": list(argv), "cwd": os.getcwd()}
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+        client.connect(socket_path)
+        client.sendall(json.dumps(request).encode() + b"\n")
+        with client.makefile("rb") as stream:
+            response = json.loads(stream.readline())
+    if not isinstance(response, dict) or not isinstance(
+        response.get("output"), str
+    ) or not isinstance(response.get("status"), int):
+        raise ValueError("malformed server response")
+    return response["status"], response["output"]
+
+
+def main():
+    """Dispatch the command line to a subcommand, server or client."""
+    args = sys.argv[1:]
+
+    if len(args) == 2 and args[0] == "serve":
+        return serve(args[1])
+
+    if len(args) >= 3 and args[0] == "--connect":
+        try:
+            status, output = call_server(args[1], args[2:])
+        except OSError as error:
+            print(f"Cannot reach server: {error}")
+            return 1
+        except ValueError as error:
+            print(f"Invalid server response: {error}")
+            return 1
+        sys.stdout.write(output)
+        return status
+
+    if not args or args[0] not in COMMANDS:
+        print_usage()
+        return 2
+
+    run_command(args[0], args[1:])
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,341 @@
+#!/usr/bin/env python3
+"""Out-of-core player store module.
+
+This module keeps player records in sorted on-disk sqlite shards so that
+the dashboard and achievement analytics can run over populations that do
+not fit in memory. Players are spread over the shards by id; each shard
+stores them in a WITHOUT ROWID table clustered by name. Queries push
+their filters down to sqlite and stream the matching rows shard by shard,
+so only one batch of rows per shard is held in memory at a time.
+
+Example:
+    python3 player_store.py build store/ 1000000 --shards 8
+    python3 player_store.py query store/
+"""
+import glob
+import heapq
+import os
+import pathlib
+import sqlite3
+import sys
+
+from dataset_generator import (
+    ACHIEVEMENTS,
+    REGIONS,
+    dataset_info,
+    generate_players,
+    iter_records,
+    player_name
+)
+
+DEFAULT_SHARDS = 8
+INSERT_BATCH = 10000
+FETCH_BATCH = 1000
+CACHE_PAGES = 2000
+SHARD_PATTERN = "shard_{:03d}.sqlite"
+
+SCHEMA = (
+    "CREATE TABLE players ("
+    " name TEXT PRIMARY KEY,"
+    " score INTEGER NOT NULL,"
+    " achievements INTEGER NOT NULL,"
+    " active INTEGER NOT NULL,"
+    " region TEXT NOT NULL"
+    ") WITHOUT ROWID",
+    "CREATE TABLE player_achievements ("
+    " achievement TEXT NOT NULL,"
+    " name TEXT NOT NULL,"
+    " PRIMARY KEY (achievement, name)"
+    ") WITHOUT ROWID"
+)
+INDEXES = (
+    "CREATE INDEX players_score ON players (score)",
+    "CREATE INDEX players_active_region ON players (active, region)"
+)
+
+
+def _connect(path, readonly=True):
+    """Open a shard with a bounded page cache."""
+    if readonly:
+        uri = pathlib.Path(path).resolve().as_uri() + "?mode=ro"
+        connection = sqlite3.connect(uri, uri=True)
+    else:
+        connection = sqlite3.connect(path)
+    connection.execute(f"PRAGMA cache_size = {CACHE_PAGES}")
+    return connection
+
+
+def _shard_paths(directory):
+    """Return the sorted shard file paths found in a store directory."""
+    pattern = os.path.join(glob.escape(directory), "shard_*.sqlite")
+    return sorted(glob.glob(pattern))
+
+
+def _flush(connection, players, achievements):
+    """Insert one batch of rows into a shard and clear the batch."""
+    connection.executemany(
+        "INSERT INTO players VALUES (?, ?, ?, ?, ?)", players
+    )
+    connection.executemany(
+        "INSERT INTO player_achievements VALUES (?, ?)", achievements
+    )
+    players.clear()
+    achievements.clear()
+
+
+def build_store(directory, records, shards=DEFAULT_SHARDS):
+    """Write player records into a new sharded store.
+
+    Args:
+        directory: The store directory; it is created if needed and must
+            not already contain shards.
+        records: Player record tuples, as produced by
+            dataset_generator.generate_players().
+        shards: The number of shard files.
+
+    Returns:
+        dict: The store, as returned by open_store().
+
+    Raises:
+        FileExistsError: If the directory already holds a store.
+    """
+    os.makedirs(directory, exist_ok=True)
+    if _shard_paths(directory):
+        raise FileExistsError(f"{directory}: a store already exists")
+
+    connections = []
+    for shard in range(shards):
+        path = os.path.join(directory, SHARD_PATTERN.format(shard))
+        connection = _connect(path, readonly=False)
+        connection.execute("PRAGMA journal_mode = OFF")
+        connection.execute("PRAGMA synchronous = OFF")
+        for statement in SCHEMA:
+            connection.execute(statement)
+        connections.append(connection)
+
+    batches = [([], []) for _ in range(shards)]
+    for player_id, score, count, active, region, bits in records:
+        name = player_name(player_id)
+        players, achievements = batches[player_id % shards]
+        players.append((name, score, count, int(active), REGIONS[region]))
+        achievements.extend(
+            (achievement, name)
+            for rank, achievement in enumerate(ACHIEVEMENTS)
+            if bits >> rank & 1
+        )
+        if len(players) == INSERT_BATCH:
+            _flush(connections[player_id % shards], players, achievements)
+
+    for connection, (players, achievements) in zip(connections, batches):
+        _flush(connection, players, achievements)
+        for statement in INDEXES:
+            connection.execute(statement)
+        connection.commit()
+        connection.close()
+    return open_store(directory)
+
+
+def open_store(directory):
+    """Open an existing sharded store.
+
+    Args:
+        directory: The store directory.
+
+    Returns:
+        dict: The store, with 'directory' and 'shards' (the shard file
+            paths) keys.
+
+    Raises:
+        FileNotFoundError: If the directory holds no shards.
+    """
+    shards = _shard_paths(directory)
+    if not shards:
+        raise FileNotFoundError(f"{directory}: no player store found")
+    return {"directory": directory, "shards": shards}
+
+
+def _stream_rows(path, query, params=()):
+    """Lazily yield the rows of a query on one shard, batch by batch."""
+    connection = _connect(path)
+    try:
+        cursor = connection.execute(query, params)
+        while True:
+            rows = cursor.fetchmany(FETCH_BATCH)
+            if not rows:
+                break
+            yield from rows
+    finally:
+        connection.close()
+
+
+def count_players(store):
+    """Return the number of players in a store."""
+    return sum(
+        row[0]
+        for path in store["shards"]
+        for row in _stream_rows(path, "SELECT COUNT(*) FROM players")
+    )
+
+
+def get_high_scorers(store, threshold=2000):
+    """Stream the names of players with high scores, in name order.
+
+    The score filter runs inside sqlite and the sorted per-shard streams
+    are merged, so memory use does not grow with the number of matches.
+
+    Args:
+        store: A store returned by open_store().
+        threshold: The minimum score of a high scorer.
+
+    Yields:
+        str: Each high scorer's name.
+    """
+    streams = [
+        _stream_rows(
+            path,
+            "SELECT name FROM players WHERE score >= ? ORDER BY name",
+            (threshold,)
+        )
+        for path in store["shards"]
+    ]
+    for (name,) in heapq.merge(*streams):
+        yield name
+
+
+def get_active_regions(store):
+    """Get set of regions with active players.
+
+    Args:
+        store: A store returned by open_store().
+
+    Returns:
+        set: Set of region names that have active players.
+    """
+    return {
+        region
+        for path in store["shards"]
+        for (region,) in _stream_rows(
+            path, "SELECT DISTINCT region FROM players WHERE active = 1"
+        )
+    }
+
+
+def achievement_counts(store):
+    """Count the players holding each achievement.
+
+    Args:
+        store: A store returned by open_store().
+
+    Returns:
+        dict: Mapping of achievement names to player counts.
+    """
+    counts = {}
+    for path in store["shards"]:
+        for achievement, count in _stream_rows(
+            path,
+            "SELECT achievement, COUNT(*) FROM player_achievements "
+            "GROUP BY achievement"
+        ):
+            counts[achievement] = counts.get(achievement, 0) + count
+    return counts
+
+
+def get_all_achievements(store):
+    """Get all unique achievements across all players.
+
+    Args:
+        store: A store returned by open_store().
+
+    Returns:
+        set: A set containing all unique achievements.
+    """
+    return set(achievement_counts(store))
+
+
+def get_rare_achievements(store):
+    """Get achievements that only one player has.
+
+    Args:
+        store: A store returned by open_store().
+
+    Returns:
+        set: A set containing achievements that only one player has.
+    """
+    return {
+        achievement
+        for achievement, count in achievement_counts(store).items()
+        if count == 1
+    }
+
+
+def print_usage():
+    """Display the command-line usage."""
+    print("Usage: python3 player_store.py build <dir> "
+          "<players.gtds|count> [--shards N]")
+    print("       python3 player_store.py query <dir>")
+
+
+def main():
+    """Build or query a player store from the command line."""
+    args = sys.argv[1:]
+    if len(args) in (3, 5) and args[0] == "build":
+        shards = DEFAULT_SHARDS
+        if len(args) == 5:
+            try:
+                shards = int(args[4])
+            except ValueError:
+                shards = 0
+            if args[3] != "--shards" or shards < 1:
+                print_usage()
+                return
+        source = args[2]
+        if os.path.exists(source):
+            try:
+                kind, _ = dataset_info(source)
+            except (OSError, ValueError) as error:
+                print(f"Cannot read dataset: {error}")
+                return
+            if kind != "players":
+                print(f"{source}: not a players dataset")
+                return
+            records = iter_records(source)
+        else:
+            try:
+                count = int(source)
+            except ValueError:
+                count = -1
+            if count < 0:
+                print(f"{source}: no such dataset file, "
+                      "and not a player count")
+                return
+            records = generate_players(count)
+        try:
+            store = build_store(args[1], records, shards)
+            total = count_players(store)
+        except (OSError, sqlite3.Error) as error:
+            print(f"Cannot build store: {error}")
+            return
+        print(f"Stored {total} players in {len(store['shards'])} shards")
+        return
+
+    if len(args) == 2 and args[0] == "query":
+        try:
+            store = open_store(args[1])
+            total = count_players(store)
+            high_scorers = sum(1 for _ in get_high_scorers(store))
+            regions = get_active_regions(store)
+            rare = get_rare_achievements(store)
+        except (OSError, sqlite3.Error) as error:
+            print(f"Cannot query store: {error}")
+            return
+        print(f"Total players: {total}")
+        print(f"High scorers (>2000): {high_scorers}")
+        print(f"Active regions: {regions}")
+        print(f"Rare achievements (1 player): {rare}")
+        return
+
+    print_usage()
+
+
+if __name__ == "__main__":
+    main()
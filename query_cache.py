@@ -0,0 +1,316 @@
+"""Versioned query cache module.
+
+This module memoizes the dashboard and achievement analytics queries.
+A dataset wraps a players dict together with version counters for each
+player field; every cached result remembers the versions of the fields
+its query reads, so a mutation only invalidates the entries that depend
+on what changed. Entries are evicted in LRU order when the cache is over
+its entry or size limits, and expire after a time-to-live.
+
+Example:
+    dataset = new_dataset(players)
+    cache = new_cache()
+    cached_query(cache, dataset, "high_scorers")
+    update_player(dataset, "alice", {"region": "south"})
+    cached_query(cache, dataset, "high_scorers")  # still a hit
+"""
+import itertools
+import time
+from collections import OrderedDict
+
+DEFAULT_MAX_ENTRIES = 256
+DEFAULT_MAX_SIZE = 1000000
+DEFAULT_TTL = 300.0
+
+# Changing the set of players affects every query.
+MEMBERSHIP = "players"
+
+QUERIES = {
+    "high_scorers": (
+        "ex6.ft_analytics_dashboard", "get_high_scorers", ("score",)
+    ),
+    "scores_doubled": (
+        "ex6.ft_analytics_dashboard", "get_scores_doubled", ("score",)
+    ),
+    "active_players": (
+        "ex6.ft_analytics_dashboard", "get_active_players", ("active",)
+    ),
+    "player_scores": (
+        "ex6.ft_analytics_dashboard", "get_player_scores", ("score",)
+    ),
+    "score_categories": (
+        "ex6.ft_analytics_dashboard", "get_score_categories", ("score",)
+    ),
+    "achievement_counts": (
+        "ex6.ft_analytics_dashboard", "get_achievement_counts",
+        ("achievements",)
+    ),
+    "unique_players": (
+        "ex6.ft_analytics_dashboard", "get_unique_players", ()
+    ),
+    "active_regions": (
+        "ex6.ft_analytics_dashboard", "get_active_regions",
+        ("active", "region")
+    ),
+    "all_achievements": (
+        "ex3.ft_achievement_tracker", "get_all_achievements",
+        ("achievements",)
+    ),
+    "common_achievements": (
+        "ex3.ft_achievement_tracker", "get_common_achievements",
+        ("achievements",)
+    ),
+    "rare_achievements": (
+        "ex3.ft_achievement_tracker", "get_rare_achievements",
+        ("achievements",)
+    )
+}
+
+_dataset_ids = itertools.count()
+
+
+def new_dataset(players):
+    """Wrap a players dict so that its changes can be tracked.
+
+    Args:
+        players: A dictionary mapping player names to their data, in the
+            ft_analytics_dashboard or ft_achievement_tracker format.
+
+    Returns:
+        dict: The dataset, with 'id', 'players', 'version',
+            'field_versions' and 'caches' keys.
+    """
+    return {
+        "id": next(_dataset_ids),
+        "players": players,
+        "version": 0,
+        "field_versions": {},
+        "caches": []
+    }
+
+
+def new_cache(max_entries=DEFAULT_MAX_ENTRIES, max_size=DEFAULT_MAX_SIZE,
+              ttl=DEFAULT_TTL, clock=time.monotonic):
+    """Create an empty query cache.
+
+    Args:
+        max_entries: The maximum number of cached results.
+        max_size: The maximum total size of the cached results, counted
+            as the len() of each result (1 for results without a length).
+        ttl: The number of seconds a result stays valid, or None.
+        clock: A function returning the current time in seconds.
+
+    Returns:
+        dict: The cache state.
+    """
+    return {
+        "entries": OrderedDict(),
+        "size": 0,
+        "max_entries": max_entries,
+        "max_size": max_size,
+        "ttl": ttl,
+        "clock": clock,
+        "stats": {
+            "hits": 0,
+            "misses": 0,
+            "evictions": 0,
+            "expirations": 0,
+            "invalidations": 0
+        }
+    }
+
+
+def _freeze(value):
+    """Return a hashable stand-in for a query parameter."""
+    if isinstance(value, (set, frozenset)):
+        return frozenset(value)
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(item) for item in value)
+    if isinstance(value, dict):
+        return frozenset((key, _freeze(item)) for key, item in value.items())
+    return value
+
+
+def _result_size(result):
+    """Return the size charged to the cache for a result."""
+    try:
+        return len(result)
+    except TypeError:
+        return 1
+
+
+def _field_versions(dataset, fields):
+    """Snapshot the versions of the fields a query depends on."""
+    versions = dataset["field_versions"]
+    return tuple(
+        versions.get(field, 0) for field in (MEMBERSHIP,) + tuple(fields)
+    )
+
+
+def _drop(cache, key, reason):
+    """Remove one entry from a cache and count why it was removed."""
+    entry = cache["entries"].pop(key)
+    cache["size"] -= entry["size"]
+    cache["stats"][reason] += 1
+
+
+def _over_limits(cache):
+    """Return whether a cache holds too many entries or too much data."""
+    return (
+        len(cache["entries"]) > cache["max_entries"]
+        or cache["size"] > cache["max_size"]
+    )
+
+
+def _enforce_limits(cache, now):
+    """Shrink the cache until it fits its limits.
+
+    Expired entries go first, wherever they are in LRU order, so that
+    they never push out live ones; then the least recently used entries
+    are evicted.
+    """
+    entries = cache["entries"]
+    if cache["ttl"] is not None and _over_limits(cache):
+        expired = [
+            key for key, entry in entries.items()
+            if now - entry["created"] > cache["ttl"]
+        ]
+        for key in expired:
+            _drop(cache, key, "expirations")
+    while entries and _over_limits(cache):
+        _drop(cache, next(iter(entries)), "evictions")
+
+
+def cached_query(cache, dataset, query, *params):
+    """Run a registered query through the cache.
+
+    Cached results are shared between callers and must be treated as
+    read-only.
+
+    Args:
+        cache: A cache created by new_cache().
+        dataset: A dataset created by new_dataset().
+        query: A key of QUERIES.
+        *params: Extra arguments passed to the query after the players,
+            e.g. the set of all achievements for "rare_achievements".
+
+    Returns:
+        The result of the query function.
+    """
+    module_name, function_name, fields = QUERIES[query]
+    if not any(known is cache for known in dataset["caches"]):
+        dataset["caches"].append(cache)
+
+    key = (dataset["id"], query, _freeze(params))
+    versions = _field_versions(dataset, fields)
+    now = cache["clock"]()
+    entries = cache["entries"]
+    entry = entries.get(key)
+    if entry is not None:
+        if cache["ttl"] is not None and now - entry["created"] > cache["ttl"]:
+            _drop(cache, key, "expirations")
+        elif entry["versions"] != versions:
+            _drop(cache, key, "invalidations")
+        else:
+            entries.move_to_end(key)
+            cache["stats"]["hits"] += 1
+            return entry["result"]
+
+    cache["stats"]["misses"] += 1
+    module = __import__(module_name, fromlist=[function_name])
+    result = getattr(module, function_name)(dataset["players"], *params)
+
+    size = _result_size(result)
+    if size <= cache["max_size"]:
+        entries[key] = {
+            "result": result,
+            "versions": versions,
+            "fields": (MEMBERSHIP,) + tuple(fields),
+            "created": now,
+            "size": size
+        }
+        cache["size"] += size
+        _enforce_limits(cache, now)
+    return result
+
+
+def mark_changed(dataset, fields):
+    """Record that some player fields changed and drop dependent entries.
+
+    Call this after mutating dataset["players"] directly, e.g. after
+    adding an achievement to a player's set ("achievements").
+
+    Args:
+        dataset: A dataset created by new_dataset().
+        fields: The names of the fields that changed; MEMBERSHIP stands
+            for players being added or removed.
+    """
+    fields = set(fields)
+    dataset["version"] += 1
+    for field in fields:
+        dataset["field_versions"][field] = dataset["version"]
+
+    for cache in dataset["caches"]:
+        stale = [
+            key for key, entry in cache["entries"].items()
+            if key[0] == dataset["id"] and fields.intersection(entry["fields"])
+        ]
+        for key in stale:
+            _drop(cache, key, "invalidations")
+
+
+def update_player(dataset, name, changes):
+    """Update some fields of a player's data dictionary.
+
+    Args:
+        dataset: A dataset of ft_analytics_dashboard style players.
+        name: The name of an existing player.
+        changes: A dictionary of the fields to set.
+    """
+    data = dataset["players"][name]
+    changed = [field for field, value in changes.items()
+               if data.get(field) != value]
+    data.update(changes)
+    if changed:
+        mark_changed(dataset, changed)
+
+
+def add_player(dataset, name, data):
+    """Add or replace a player.
+
+    Args:
+        dataset: A dataset created by new_dataset().
+        name: The name of the player.
+        data: The player's data.
+    """
+    dataset["players"][name] = data
+    mark_changed(dataset, (MEMBERSHIP,))
+
+
+def remove_player(dataset, name):
+    """Remove a player.
+
+    Args:
+        dataset: A dataset created by new_dataset().
+        name: The name of an existing player.
+    """
+    del dataset["players"][name]
+    mark_changed(dataset, (MEMBERSHIP,))
+
+
+def cache_stats(cache):
+    """Return the hit, miss and eviction statistics of a cache.
+
+    Args:
+        cache: A cache created by new_cache().
+
+    Returns:
+        dict: The counters, the current 'entries' and 'size', and the
+            'hit_rate' of the lookups so far.
+    """
+    stats = dict(cache["stats"])
+    lookups = stats["hits"] + stats["misses"]
+    stats["entries"] = len(cache["entries"])
+    stats["size"] = cache["size"]
+    stats["hit_rate"] = stats["hits"] / lookups if lookups else 0.0
+    return stats